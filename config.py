@@ -9,6 +9,8 @@ Contains all configurable game parameters in one place for easy modification.
 SCREEN_WIDTH = 2400
 SCREEN_HEIGHT = 1350
 FPS = 60
+# Longest the main loop blocks waiting for input while nothing animates (ms).
+IDLE_EVENT_TIMEOUT_MS = 250
 
 # Grid Layout
 GRID_ROWS = 3
@@ -51,6 +53,7 @@ BLACK_ALPHA_200 = (0, 0, 0, 200)     # Black with alpha for overlays
 # Image Settings
 DUEL_IMAGE_WIDTH = 1440
 DUEL_IMAGE_HEIGHT = 810
+DUEL_IMAGE_CACHE_SIZE = 64  # Max scaled images kept in memory across duels
 
 # Layout Settings
 FLOOR_TOP_MARGIN = 100
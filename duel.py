@@ -14,10 +14,197 @@ It expects a main script (e.g. main.py) to:
     - call handle_event(), update(), draw() each frame
 """
 
+import concurrent.futures
+import functools
 import pygame
 import os
 import config
 
+# Optional: OpenCV's SIMD resize is faster than pygame's smoothscale().
+try:
+    import cv2
+    import numpy as np
+except ImportError:
+    cv2 = None
+
+# File extensions (lowercase) treated as duel images.
+IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.bmp', '.gif'}
+
+# Sub-folder (inside each category folder) holding pre-scaled copies.
+PRESCALED_DIR = f".cache_{config.DUEL_IMAGE_WIDTH}x{config.DUEL_IMAGE_HEIGHT}"
+
+
+def _list_image_files(folder_path):
+    """
+    Return the image files in a folder as os.DirEntry objects, sorted by name.
+    """
+    with os.scandir(folder_path) as it:
+        return sorted(
+            (e for e in it if os.path.splitext(e.name)[1].lower() in IMAGE_EXTENSIONS and e.is_file()),
+            key=lambda e: e.name
+        )
+
+
+def _prescaled_path(path):
+    """
+    Path of the pre-scaled copy of an image, e.g.
+    images/Nature/01-Peppers.jpg -> images/Nature/.cache_1440x810/01-Peppers.jpg.bmp
+    """
+    folder, filename = os.path.split(path)
+    return os.path.join(folder, PRESCALED_DIR, filename + ".bmp")
+
+
+def _duel_size_marker_path(path):
+    """
+    Path of the empty marker file recording that an image is already the
+    duel size (and so has no pre-scaled copy), e.g.
+    images/Nature/01-Peppers.jpg -> images/Nature/.cache_1440x810/01-Peppers.jpg.same
+    """
+    folder, filename = os.path.split(path)
+    return os.path.join(folder, PRESCALED_DIR, filename + ".same")
+
+
+def _is_newer(cached, path):
+    """
+    True if the file `cached` exists and is at least as new as `path`.
+    """
+    try:
+        return os.stat(cached).st_mtime_ns >= os.stat(path).st_mtime_ns
+    except OSError:
+        return False
+
+
+def _has_fresh_prescaled(path):
+    """
+    True if the pre-scaled copy of an image exists and is newer than the source.
+    """
+    return _is_newer(_prescaled_path(path), path)
+
+
+def _needs_prescale(path):
+    """
+    True if prescale_images() still has to look at an image: it has neither
+    an up-to-date pre-scaled copy nor an up-to-date duel-size marker.
+    """
+    return not (_has_fresh_prescaled(path) or _is_newer(_duel_size_marker_path(path), path))
+
+
+def _scale_to_duel_size(img):
+    """
+    Scale an image to the duel image size, returning it unchanged if it
+    already has that size.
+
+    Always scales smoothly: nearest-neighbour scale() makes text and edges
+    in logos and covers look jagged, and each image is only scaled once
+    anyway (results are cached in memory and pre-scaled on disk).
+    """
+    size = (config.DUEL_IMAGE_WIDTH, config.DUEL_IMAGE_HEIGHT)
+    if img.get_size() == size:
+        return img
+    return _smoothscale(img, size)
+
+
+def _smoothscale(img, size):
+    """
+    Smoothly scale an image, using OpenCV when it is installed
+    (area averaging when shrinking both axes, bilinear otherwise) and
+    pygame.transform.smoothscale() otherwise.
+    """
+    if cv2 is None:
+        return pygame.transform.smoothscale(img, size)
+
+    w, h = img.get_size()
+    pixels = np.frombuffer(pygame.image.tobytes(img, "RGBA"), np.uint8).reshape(h, w, 4)
+    # Area averaging only when shrinking on both axes; it is meant for
+    # downscales and is a poor fit for an axis that gets upscaled.
+    interpolation = cv2.INTER_AREA if w >= size[0] and h >= size[1] else cv2.INTER_LINEAR
+    pixels = cv2.resize(pixels, size, interpolation=interpolation)
+    return pygame.image.frombuffer(pixels.tobytes(), size, "RGBA").convert_alpha()
+
+
+def _load_and_scale(path):
+    """
+    Load an image from disk and scale it to the duel image size.
+    """
+    return _scale_to_duel_size(pygame.image.load(path).convert_alpha())
+
+
+def _scale_and_save(path):
+    """
+    Load an image, scale it to the duel image size, and write the
+    pre-scaled copy next to it. Images that are already the right size
+    need no copy; an empty marker file is written instead, so later runs
+    skip them without decoding them again.
+
+    Returns True if a pre-scaled copy was written.
+    """
+    img = pygame.image.load(path).convert_alpha()
+    scaled = _scale_to_duel_size(img)
+    cached = _prescaled_path(path) if scaled is not img else _duel_size_marker_path(path)
+    try:
+        os.makedirs(os.path.dirname(cached), exist_ok=True)
+        if scaled is img:
+            open(cached, "wb").close()
+            return False
+        pygame.image.save(scaled, cached)
+    except (OSError, pygame.error) as e:
+        print(f"Could not save pre-scaled image {cached}: {e}")
+        return False
+    return True
+
+
+@functools.lru_cache(maxsize=config.DUEL_IMAGE_CACHE_SIZE)
+def _load_scaled_image(path):
+    """
+    Load an image scaled to the duel image size.
+
+    Uses the pre-scaled copy on disk when it is up to date, otherwise
+    scales the original in memory. Never writes to disk: pre-scaled
+    copies are made ahead of time by prescale_images(). Results are
+    also cached in memory across DuelScreen instances (keyed by absolute
+    path), so replaying a category does not decode its images again.
+    """
+    if _has_fresh_prescaled(path):
+        return pygame.image.load(_prescaled_path(path)).convert_alpha()
+    return _load_and_scale(path)
+
+
+def _init_prescale_worker():
+    """
+    Worker process setup: convert_alpha() needs a display, so open a
+    tiny one on the dummy video driver.
+    """
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+
+
+def prescale_images(folder_paths, max_workers=None):
+    """
+    Write pre-scaled copies of every image in the given folders that does
+    not already have an up-to-date one (or is not already known to be the
+    duel size), using a pool of worker processes.
+
+    Returns the number of pre-scaled copies written.
+    """
+    paths = []
+    for folder_path in folder_paths:
+        if os.path.isdir(folder_path):
+            paths.extend(e.path for e in _list_image_files(folder_path) if _needs_prescale(e.path))
+    if not paths:
+        return 0
+
+    scaled = 0
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers, initializer=_init_prescale_worker) as pool:
+        futures = {pool.submit(_scale_and_save, path): path for path in paths}
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                if future.result():
+                    scaled += 1
+            except Exception as e:
+                print(f"Failed to pre-scale image {futures[future]}: {e}")
+    return scaled
+
 
 class DuelScreen:
     """
@@ -45,34 +232,51 @@ class DuelScreen:
         self.width, self.height = self.screen.get_size()
 
         self.initial_time_ms = initial_time_ms
-        self.remaining_ms = {1: initial_time_ms, 2: initial_time_ms}
-        self.active_player = 1
+        # Per-player state is indexed by player: 0 = challenger, 1 = defender.
+        self.remaining_ms = [initial_time_ms, initial_time_ms]
+        self.active_idx = 0
+
+        # Tick (pygame.time.get_ticks()) at which the active player's timer
+        # hits zero, or None while it is stopped. remaining_ms is derived
+        # from it, so there is no per-frame drift.
+        self._deadline_ms = None
 
         self.last_tick = pygame.time.get_ticks()
         self.font = pygame.font.SysFont(None, config.DUEL_TIMER_FONT_SIZE)
         self.name_font = pygame.font.SysFont(None, config.DUEL_NAME_FONT_SIZE)
         self.answer_font = pygame.font.SysFont(None, config.DUEL_ANSWER_FONT_SIZE)
 
+        # Timer labels for every whole-second value a timer can show.
+        self._sec_strs = tuple(str(i) for i in range(initial_time_ms // 1000 + 1))
+
+        # Rendered timer surfaces keyed by whole-second value.
+        # The timers only show whole seconds, so each value is rendered once.
+        self._timer_cache = {}
+        # Highlight boxes keyed by size (timer widths vary with digit count).
+        self._highlight_cache = {}
+        # Timer + highlight Rects keyed by whole-second value (see _get_timer_rects).
+        self._timer_rect_cache = {}
+        self._t1_topleft = (20, 20)
+        self._t2_topright = (self.width - 20, 20)
+
         # Store meta-info coming from the FloorScreen:
         self.challenger_name = challenger_name
         self.defender_name = defender_name
         self.defender_category = defender_category
-        self.names_dict = {
-            1: challenger_name,
-            2: defender_name,
-        }
+        self.names = [challenger_name, defender_name]
 
         # Pause functionality
         self.paused = False
 
         # Answer reveal state
         self.reveal_answer_mode = False
-        self.reveal_timer_ms = 0
+        self.reveal_end_ms = 0  # Tick at which the reveal ends
         self.current_answer = ""
+        self._answer_surf = None  # Rendered current_answer, set while it is shown
 
         # Pass penalty state
         self.pass_penalty_mode = False
-        self.pass_penalty_timer_ms = 0
+        self.pass_penalty_end_ms = 0  # Tick at which the penalty ends
 
         # Print to console
         print(
@@ -82,25 +286,93 @@ class DuelScreen:
             "\n\tdefender_category  =", defender_category
         )
 
-        self.images, self.image_filenames = self._load_images_from_folder(f"{config.IMAGES_BASE_PATH}/{defender_category}")
+        self.images, self.image_filenames, self._image_paths = self._load_images_from_folder(f"{config.IMAGES_BASE_PATH}/{defender_category}")
         self.current_image_index = 0
+        # Load the first question image now, while the starter image is shown,
+        # so the challenger's clock never pays for decoding it.
+        self._get_image(1 % len(self.images))
 
-        self.winner = None  # 1 or 2 when someone wins, else None
+        self.winner = None  # name of the winning player, else None
         self.loser = None
         self.request_screen_change = None
 
         self.started = False
 
+        # Set whenever something visible changes; draw() skips otherwise.
+        self._dirty = True
+        # Screen Rects drawn by the previous draw() call (None before the first).
+        self._last_drawn_rects = None
+
+        # Static HUD text never changes during a duel, so render it once.
+        self._name1_surf = self._render_static_text(self.name_font, challenger_name, config.WHITE)
+        self._name2_surf = self._render_static_text(self.name_font, defender_name, config.WHITE)
+        self._category_surf = self._render_static_text(self.name_font, defender_category, config.WHITE)
+
+        # PAUSED overlay (text + semi-transparent background), centered on screen.
+        self._paused_surf = self._render_static_text(self.font, "PAUSED", config.RED)
+        self._paused_rect = self._paused_surf.get_rect(center=(self.width // 2, self.height // 2))
+        paused_bg_rect = self._paused_rect.inflate(40, 20)
+        self._paused_bg = self._create_overlay(paused_bg_rect.size, config.BLACK_ALPHA_200)
+        self._paused_bg_rect = paused_bg_rect
+
+        # Answer background: one full-width strip, of which only the part
+        # covering the answer text is blitted.
+        self._answer_bg = self._create_overlay(
+            (self.width, self.answer_font.get_height() * 2),
+            config.BLACK_ALPHA_180
+        )
+
+        # Name/category positions depend on the timer height, so they are
+        # computed on the first draw() call.
+        self._static_text_laid_out = False
+        self._name1_rect = None
+        self._name2_rect = None
+        self._category_rect = None
+
     # ------------------------------------------------------------------
     # INTERNAL HELPERS
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _render_static_text(font, text, color):
+        """
+        Render text once for reuse across frames.
+        Returns None if there is no text to render.
+        """
+        if not text:
+            return None
+        return font.render(text, True, color).convert_alpha()
+
+    @staticmethod
+    def _create_overlay(size, rgba):
+        """
+        Create a solid overlay Surface with a single surface-wide alpha,
+        which blits much faster than a per-pixel alpha (SRCALPHA) Surface.
+        """
+        surf = pygame.Surface(size).convert()
+        surf.fill(rgba[:3])
+        surf.set_alpha(rgba[3])
+        return surf
+
+    def _layout_static_text(self, t1_rect, t2_rect):
+        """
+        Compute the fixed positions of the player names and category.
+        """
+        if self._name1_surf:
+            self._name1_rect = self._name1_surf.get_rect(topleft=(20, t1_rect.bottom + 15))
+        if self._name2_surf:
+            self._name2_rect = self._name2_surf.get_rect(topright=(self.width - 20, t2_rect.bottom + 15))
+        if self._category_surf:
+            self._category_rect = self._category_surf.get_rect(midtop=(self.width // 2, 20))
+        self._static_text_laid_out = True
+
     def _create_starter_image(self):
         """
         Create a placeholder image before duel begins.
         Returns a single Surface.
         """
-        surf = pygame.Surface((config.DUEL_IMAGE_WIDTH, config.DUEL_IMAGE_HEIGHT), pygame.SRCALPHA)
+        # Fully opaque, so skip per-pixel alpha and match the display format.
+        surf = pygame.Surface((config.DUEL_IMAGE_WIDTH, config.DUEL_IMAGE_HEIGHT)).convert()
         surf.fill(config.LIGHT_BLUE)
 
         # Fill with text
@@ -118,7 +390,8 @@ class DuelScreen:
         Create a placeholder image after duel ends.
         Returns a single Surface.
         """
-        surf = pygame.Surface((config.DUEL_IMAGE_WIDTH, config.DUEL_IMAGE_HEIGHT), pygame.SRCALPHA)
+        # Fully opaque, so skip per-pixel alpha and match the display format.
+        surf = pygame.Surface((config.DUEL_IMAGE_WIDTH, config.DUEL_IMAGE_HEIGHT)).convert()
         surf.fill(config.LIGHT_BLUE)
 
         # Split the message into lines
@@ -145,46 +418,141 @@ class DuelScreen:
 
         return surf 
 
-    def _load_images_from_folder(self, folder_path):
+    def _create_failed_image(self):
+        """
+        Create a placeholder for an image that could not be loaded, labelled
+        so the players can see the prompt is broken (and pass it) rather
+        than stare at a blank question. The filename is not shown, since
+        it contains the answer.
+        Returns a single Surface.
         """
-        Loads all image files from the given folder and returns a tuple of:
-        (list of Surfaces, list of filenames)
+        # Fully opaque, so skip per-pixel alpha and match the display format.
+        surf = pygame.Surface((config.DUEL_IMAGE_WIDTH, config.DUEL_IMAGE_HEIGHT)).convert()
+        surf.fill(config.LIGHT_BLUE)
+
+        label = self.font.render("Image failed to load", True, config.RED)
+        hint_label = self.answer_font.render("Press X to pass", True, (0, 0, 0))
+
+        # Stack both lines, centered vertically
+        start_y = (surf.get_height() - label.get_height() - hint_label.get_height()) // 2
+        for line in (label, hint_label):
+            line_rect = line.get_rect(centerx=surf.get_width() // 2, y=start_y)
+            surf.blit(line, line_rect)
+            start_y += line.get_height()
+
+        return surf
+
+    def _load_images_from_folder(self, folder_path):
         """
-        images = []
-        filenames = []
+        Finds all image files in the given folder and returns a tuple of:
+        (list of Surfaces, list of filenames, list of paths)
 
-        images.append(self._create_starter_image())
-        filenames.append(None)  # No filename for starter image
+        Only the starter image is created here; the folder images are
+        left as None and loaded on first use by _get_image().
+        """
+        images = [self._create_starter_image()]
+        filenames = [None]  # No filename for starter image
+        paths = [None]
 
         if not os.path.isdir(folder_path):
             print(f"Image folder not found: {folder_path}")
-            return images, filenames
-
-        for filename in sorted(os.listdir(folder_path)):
-            if filename.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp', '.gif')):
-                full_path = os.path.join(folder_path, filename)
-                try:
-                    img = pygame.image.load(full_path).convert_alpha()
-                    img = pygame.transform.smoothscale(img, (config.DUEL_IMAGE_WIDTH, config.DUEL_IMAGE_HEIGHT))
-                    images.append(img)
-                    filenames.append(filename)
-                except Exception as e:
-                    print(f"Failed to load image {full_path}: {e}")
-        return images, filenames
+            return images, filenames, paths
 
-    @staticmethod
-    def _format_time(ms: int) -> str:
+        for entry in _list_image_files(folder_path):
+            images.append(None)
+            filenames.append(entry.name)
+            paths.append(entry.path)
+        return images, filenames, paths
+
+    def _get_image(self, index):
         """
-        Convert milliseconds to seconds format (whole seconds only).
+        Return the image Surface at the given index, loading and
+        scaling it from disk the first time it is needed.
+        """
+        img = self.images[index]
+        if img is None:
+            full_path = self._image_paths[index]
+            try:
+                img = _load_scaled_image(os.path.abspath(full_path))
+            except Exception as e:
+                print(f"Failed to load image {full_path}: {e}")
+                img = self._create_failed_image()
+            self.images[index] = img
+        return img
+
+    def _render_timer(self, secs):
+        """
+        Return the timer Surface for a whole-second value,
+        rendering and caching it on first use.
+        """
+        surf = self._timer_cache.get(secs)
+        if surf is None:
+            surf = self.font.render(self._sec_strs[secs], True, config.WHITE).convert_alpha()
+            self._timer_cache[secs] = surf
+        return surf
 
-        Example:
-            30450 ms -> "30"
+    def _update_active_timer(self, now):
+        """
+        Bring the active player's remaining_ms up to date with `now`, then
+        start or stop its deadline to match the duel state.
+
+        The timer runs once the duel has started, except while paused,
+        while an answer is revealed (unless a pass penalty is also running),
+        or after someone has won. Marks the view dirty when the displayed
+        whole second changes.
+        """
+        if self._deadline_ms is not None:
+            before = self.remaining_ms[self.active_idx]
+            after = max(0, self._deadline_ms - now)
+            self.remaining_ms[self.active_idx] = after
+            if after // 1000 != before // 1000:
+                self._dirty = True
+
+        running = (
+            self.started
+            and not self.paused
+            and not self.winner
+            and (self.pass_penalty_mode or not self.reveal_answer_mode)
+        )
+        if not running:
+            self._deadline_ms = None
+        elif self._deadline_ms is None:
+            self._deadline_ms = now + self.remaining_ms[self.active_idx]
+
+    def _get_timer_rects(self, secs):
         """
-        ms = max(0, ms)  # prevent negative values
+        Return the screen Rects for a whole-second timer value as
+        (left_rect, right_rect, left_highlight_rect, right_highlight_rect).
 
-        total_seconds = ms // 1000
+        Positions are fixed, so each value's Rects are computed once.
+        """
+        rects = self._timer_rect_cache.get(secs)
+        if rects is None:
+            surf = self._render_timer(secs)
+            # Player 1 at top-left; player 2 at top-right, 20 px from right edge.
+            left_rect = surf.get_rect(topleft=self._t1_topleft)
+            right_rect = surf.get_rect(topright=self._t2_topright)
+            padding = 10
+            rects = (
+                left_rect,
+                right_rect,
+                left_rect.inflate(padding * 2, padding * 2),
+                right_rect.inflate(padding * 2, padding * 2),
+            )
+            self._timer_rect_cache[secs] = rects
+        return rects
 
-        return f"{total_seconds}"
+    def _get_highlight(self, size):
+        """
+        Return a solid green Surface of the given size for the
+        active-timer highlight box, creating it on first use.
+        """
+        surf = self._highlight_cache.get(size)
+        if surf is None:
+            surf = pygame.Surface(size).convert()
+            surf.fill(config.GREEN)
+            self._highlight_cache[size] = surf
+        return surf
 
     @staticmethod
     def _parse_answer_from_filename(filename):
@@ -198,14 +566,11 @@ class DuelScreen:
             return ""
 
         # Remove file extension
-        name_without_ext = os.path.splitext(filename)[0]
-
-        # Split on '-' and take everything after the first part
-        parts = name_without_ext.split('-', 1)
-        if len(parts) > 1:
-            return parts[1].strip()
+        name_without_ext = filename.rpartition('.')[0] or filename
 
-        return name_without_ext.strip()
+        # Take everything after the first '-' (or the whole name if there is none)
+        _, sep, rest = name_without_ext.partition('-')
+        return (rest if sep else name_without_ext).strip()
 
     # ------------------------------------------------------------------
     # PUBLIC INTERFACE
@@ -224,21 +589,21 @@ class DuelScreen:
                 # Toggle pause (but not during answer reveal or when duel hasn't started)
                 if self.started and not self.winner and not self.reveal_answer_mode and not self.pass_penalty_mode:
                     self.paused = not self.paused
+                    self._dirty = True
 
             elif event.key == pygame.K_x:
                 # Pass function - 3 second penalty, show answer in red, stay with same player
                 if self.started and not self.winner and not self.paused and not self.reveal_answer_mode and not self.pass_penalty_mode:
                     self.pass_penalty_mode = True
-                    self.pass_penalty_timer_ms = config.PASS_PENALTY_TIME_MS
-                    # Parse answer from current image filename
-                    current_filename = self.image_filenames[self.current_image_index]
-                    self.current_answer = self._parse_answer_from_filename(current_filename)
+                    self.pass_penalty_end_ms = pygame.time.get_ticks() + config.PASS_PENALTY_TIME_MS
+                    self._show_current_answer(config.RED)
 
             elif event.key == pygame.K_SPACE:
                 if not self.started:
                     # At beginning of round, press SPACE to start.
                     self.started = True
                     self.current_image_index = (self.current_image_index + 1) % len(self.images)
+                    self._dirty = True
                 elif self.winner:
                     # If duel is over, press SPACE to return to FloorScreen.
                     self.request_screen_change = {
@@ -250,176 +615,179 @@ class DuelScreen:
                 elif not self.paused and not self.reveal_answer_mode:
                     # Enter answer reveal mode
                     self.reveal_answer_mode = True
-                    self.reveal_timer_ms = config.ANSWER_REVEAL_TIME_MS
-                    # Parse answer from current image filename
-                    current_filename = self.image_filenames[self.current_image_index]
-                    self.current_answer = self._parse_answer_from_filename(current_filename)
+                    self.reveal_end_ms = pygame.time.get_ticks() + config.ANSWER_REVEAL_TIME_MS
+                    self._show_current_answer(config.YELLOW)
 
             # You *could* also handle ESC here, but usually main.py handles quitting.
 
+            # Start/stop the active timer to match the new state.
+            self._update_active_timer(pygame.time.get_ticks())
+
+    @property
+    def needs_animation(self):
+        """
+        True while the main loop has to keep ticking at full frame rate:
+        a timer is running, an answer reveal or pass penalty is counting
+        down, or a change has not been drawn yet. Otherwise (before the
+        start, while paused, after the duel) the view only changes in
+        response to input, so the loop can block waiting for events.
+        """
+        return (
+            self._deadline_ms is not None
+            or self.reveal_answer_mode
+            or self.pass_penalty_mode
+            or self._dirty
+        )
+
+    def _show_current_answer(self, color):
+        """
+        Parse the answer for the current image and render it once in the
+        given color. Also loads the next image while the answer is shown.
+        """
+        current_filename = self.image_filenames[self.current_image_index]
+        self.current_answer = self._parse_answer_from_filename(current_filename)
+        self._answer_surf = self._render_static_text(self.answer_font, self.current_answer, color)
+        self._get_image((self.current_image_index + 1) % len(self.images))
+        self._dirty = True
+
     def update(self, delta_ms):
         """
         Update the internal state of the duel.
 
         :param delta_ms: time elapsed since last frame, in milliseconds.
-                         Typically from clock.tick().
+                         Unused: timers are deadlines on pygame's tick clock,
+                         so elapsed time is read from pygame.time.get_ticks().
         """
-        # Handle pass penalty countdown
+        now = pygame.time.get_ticks()
+        self._update_active_timer(now)
+
+        # Handle pass penalty countdown (active timer keeps running)
         if self.pass_penalty_mode:
-            # Timer continues counting down (penalty)
-            if self.remaining_ms[self.active_player] > 0:
-                self.remaining_ms[self.active_player] = max(
-                    0,
-                    self.remaining_ms[self.active_player] - delta_ms
-                )
-
-            # Pass penalty timer counts down
-            self.pass_penalty_timer_ms = max(0, self.pass_penalty_timer_ms - delta_ms)
-            if self.pass_penalty_timer_ms == 0:
+            if now >= self.pass_penalty_end_ms:
                 # Penalty period is over, advance to next image but keep same player
                 self.pass_penalty_mode = False
                 self.current_image_index = (self.current_image_index + 1) % len(self.images)
                 self.current_answer = ""
+                self._answer_surf = None
+                self._dirty = True
+                self._update_active_timer(now)
             return
 
-        # Handle answer reveal countdown
+        # Handle answer reveal countdown (active timer is stopped)
         if self.reveal_answer_mode:
-            self.reveal_timer_ms = max(0, self.reveal_timer_ms - delta_ms)
-            if self.reveal_timer_ms == 0:
+            if now >= self.reveal_end_ms:
                 # Reveal period is over, switch to next player
                 self.reveal_answer_mode = False
-                self.active_player = 2 if self.active_player == 1 else 1
+                self.active_idx = 1 - self.active_idx
                 self.current_image_index = (self.current_image_index + 1) % len(self.images)
                 self.current_answer = ""
+                self._answer_surf = None
+                self._dirty = True
+                self._update_active_timer(now)
             return
 
-        # Only countdown timer if not paused and duel has started
-        if self.started and not self.paused and self.remaining_ms[self.active_player] > 0:
-            self.remaining_ms[self.active_player] = max(
-                0,
-                self.remaining_ms[self.active_player] - delta_ms
-            )
-
         # Identify winner if any player's time reaches zero.
-        if self.remaining_ms[self.active_player] == 0:
-            self.winner = self.names_dict[3 - self.active_player]
-            self.loser = self.names_dict[self.active_player]
+        if self.remaining_ms[self.active_idx] == 0 and not self.winner:
+            self.winner = self.names[1 - self.active_idx]
+            self.loser = self.names[self.active_idx]
             # Optionally, create and append the ending image.
             self.images.append(self._create_ending_image(self.winner))
             self.image_filenames.append(None)  # No filename for ending image
+            self._image_paths.append(None)
             self.current_image_index = len(self.images) - 1
+            self._dirty = True
+            self._update_active_timer(now)
 
     def draw(self):
         """
         Draw the entire duel view to the screen.
+
+        All Surfaces are collected into one list and drawn with a single
+        blits() call, in back-to-front order.
+
+        Returns the list of screen Rects that changed (for
+        pygame.display.update()): everything drawn this frame plus
+        everything drawn last frame, so vacated areas are cleared too.
+        Returns [] if the view has not changed since the last draw.
         """
+        if not self._dirty:
+            return []
+
         # Clear the screen with a background color.
         self.screen.fill(config.DUEL_BG_COLOR)
 
         # -------------------------
-        # Draw center image
+        # Center image
         # -------------------------
-        current_image = self.images[self.current_image_index]
+        current_image = self._get_image(self.current_image_index)
         image_rect = current_image.get_rect(center=(self.width // 2, self.height // 2))
-        # "blit" = copy one Surface onto another.
-        self.screen.blit(current_image, image_rect)
+        draws = [(current_image, image_rect)]
 
         # -------------------------
-        # Draw timers
+        # Timers
         # -------------------------
 
-        # Render timer text for each player.
-        t1_text = self.font.render(
-            self._format_time(self.remaining_ms[1]),
-            True,
-            config.WHITE
-        )
-        t2_text = self.font.render(
-            self._format_time(self.remaining_ms[2]),
-            True,
-            config.WHITE
-        )
+        # Fetch (cached) timer text for each player.
+        sec1 = max(0, self.remaining_ms[0]) // 1000
+        sec2 = max(0, self.remaining_ms[1]) // 1000
+        t1_text = self._render_timer(sec1)
+        t2_text = self._render_timer(sec2)
 
-        # Position player 1 timer at top-left.
-        t1_rect = t1_text.get_rect(topleft=(20, 20))
-        # Position player 2 timer at top-right, 20 px from right edge.
-        t2_rect = t2_text.get_rect(topright=(self.width - 20, 20))
+        # Player 1 timer sits top-left, player 2 timer top-right.
+        t1_rect, _, t1_highlight_rect, _ = self._get_timer_rects(sec1)
+        _, t2_rect, _, t2_highlight_rect = self._get_timer_rects(sec2)
 
         # Highlight box behind active player's timer so it's visually clear.
-        padding = 10
-        if self.active_player == 1:
-            highlight_rect = t1_rect.inflate(padding * 2, padding * 2)
+        if self.active_idx == 0:
+            highlight_rect = t1_highlight_rect
         else:
-            highlight_rect = t2_rect.inflate(padding * 2, padding * 2)
+            highlight_rect = t2_highlight_rect
+        draws.append((self._get_highlight(highlight_rect.size), highlight_rect))
 
-        # Draw filled rectangle for highlight.
-        pygame.draw.rect(self.screen, config.GREEN, highlight_rect)
-
-        # Draw timer texts.
-        self.screen.blit(t1_text, t1_rect)
-        self.screen.blit(t2_text, t2_rect)
+        draws.append((t1_text, t1_rect))
+        draws.append((t2_text, t2_rect))
 
         # -------------------------
-        # Draw player names under timers
+        # Player names under timers + category at top center
         # -------------------------
-        if self.challenger_name:
-            name1_text = self.name_font.render(
-                self.challenger_name,
-                True,
-                config.WHITE
-            )
-            name1_rect = name1_text.get_rect(topleft=(20, t1_rect.bottom + 15))
-            self.screen.blit(name1_text, name1_rect)
-
-        if self.defender_name:
-            name2_text = self.name_font.render(
-                self.defender_name,
-                True,
-                config.WHITE
-            )
-            name2_rect = name2_text.get_rect(topright=(self.width - 20, t2_rect.bottom + 15))
-            self.screen.blit(name2_text, name2_rect)
+        if not self._static_text_laid_out:
+            self._layout_static_text(t1_rect, t2_rect)
 
-        # -------------------------
-        # Draw category at top center
-        # -------------------------
-        if self.defender_category:
-            category_text = self.name_font.render(
-                self.defender_category,
-                True,
-                config.WHITE
-            )
-            category_rect = category_text.get_rect(midtop=(self.width // 2, 20))
-            self.screen.blit(category_text, category_rect)
+        if self._name1_surf:
+            draws.append((self._name1_surf, self._name1_rect))
+        if self._name2_surf:
+            draws.append((self._name2_surf, self._name2_rect))
+        if self._category_surf:
+            draws.append((self._category_surf, self._category_rect))
 
         # -------------------------
-        # Draw answer text if in reveal mode or pass penalty mode
+        # Answer text if in reveal mode or pass penalty mode
         # -------------------------
-        if (self.reveal_answer_mode or self.pass_penalty_mode) and self.current_answer:
-            # Use red for pass penalty, yellow for normal reveal
-            answer_color = config.RED if self.pass_penalty_mode else config.YELLOW
-            answer_text = self.answer_font.render(
-                f"{self.current_answer}",
-                True,
-                answer_color
-            )
+        if self._answer_surf:
+            # Rendered on entering the mode: red for pass penalty, yellow for normal reveal
+            answer_text = self._answer_surf
             answer_rect = answer_text.get_rect(center=(self.width // 2, image_rect.bottom + 40))
-            # Draw a semi-transparent background for better readability
+            # Semi-transparent background for better readability
             bg_rect = answer_rect.inflate(20, 10)
-            bg_surface = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
-            bg_surface.fill(config.BLACK_ALPHA_180)
-            self.screen.blit(bg_surface, bg_rect)
-            self.screen.blit(answer_text, answer_rect)
+            draws.append((self._answer_bg, bg_rect, (0, 0, bg_rect.width, bg_rect.height)))
+            draws.append((answer_text, answer_rect))
 
         # -------------------------
-        # Draw PAUSED overlay
+        # PAUSED overlay
         # -------------------------
         if self.paused:
-            pause_text = self.font.render("PAUSED", True, config.RED)
-            pause_rect = pause_text.get_rect(center=(self.width // 2, self.height // 2))
-            # Draw semi-transparent background
-            bg_rect = pause_rect.inflate(40, 20)
-            bg_surface = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
-            bg_surface.fill(config.BLACK_ALPHA_200)
-            self.screen.blit(bg_surface, bg_rect)
-            self.screen.blit(pause_text, pause_rect)
+            # Semi-transparent background, then the text
+            draws.append((self._paused_bg, self._paused_bg_rect))
+            draws.append((self._paused_surf, self._paused_rect))
+
+        self.screen.blits(draws, doreturn=False)
+        self._dirty = False
+
+        drawn_rects = [entry[1] for entry in draws]
+        if self._last_drawn_rects is None:
+            # First frame: the whole screen was cleared.
+            dirty_rects = [self.screen.get_rect()]
+        else:
+            dirty_rects = self._last_drawn_rects + drawn_rects
+        self._last_drawn_rects = drawn_rects
+        return dirty_rects
@@ -26,19 +26,66 @@ The idea is to keep the grid logic modular enough
 to support future "merged squares" / territories.
 """
 
+import bisect
 import csv
+import os
 import random
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 import pygame
 import config
 
 
+# Parsed tile CSVs: path -> (file mtime in ns, tuple of (name, category)).
+_CSV_CACHE = {}
+
+
+def load_tile_data_from_csv(csv_path):
+    """
+    Load tile name/category data from a CSV file.
+
+    Expected columns: name, category
+
+    Returns a list of [name, category] lists.
+    The parsed file is cached and re-read only if it changed on disk;
+    each call returns fresh lists, so callers may modify them.
+    Raises FileNotFoundError if the file is missing.
+    """
+    mtime_ns = os.stat(csv_path).st_mtime_ns
+    cached = _CSV_CACHE.get(csv_path)
+    if cached is None or cached[0] != mtime_ns:
+        data = []
+        with open(csv_path, newline="", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            header = [column.strip() for column in next(reader, [])]
+            name_col = header.index("name")
+            category_col = header.index("category")
+            for row in reader:
+                name = row[name_col].strip() if name_col < len(row) else ""
+                category = row[category_col].strip() if category_col < len(row) else ""
+                if name:  # only add rows that have a name
+                    data.append((name, category))
+        cached = (mtime_ns, tuple(data))
+        _CSV_CACHE[csv_path] = cached
+    return [list(tile) for tile in cached[1]]
+
+
+def _to_display_format(surf, alpha=True):
+    """
+    Convert a Surface to the display's pixel format so blits skip
+    per-pixel format conversion. Returns it unchanged if no display
+    has been set up (e.g. when used without a window).
+    """
+    if pygame.display.get_surface() is None:
+        return surf
+    return surf.convert_alpha() if alpha else surf.convert()
+
+
 # ---------------------------------------------------------
 # DATA STRUCTURE: tile representation
 # ---------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class FloorTile:
     """
     Represents one logical tile on the floor grid.
@@ -52,19 +99,34 @@ class FloorTile:
         rect: pygame.Rect describing where it is drawn on screen.
         name: text to show inside tile (from CSV).
         category: extra data from CSV (for future use).
+        _surface_normal, _surface_highlight: the fully rendered cell (fill,
+                     outline and text) in the normal and highlight colors,
+                     rebuilt whenever name/category change.
+
+    Uses __slots__: no per-instance __dict__, and assigning an attribute
+    that is not declared here raises AttributeError. Not frozen, since
+    name/category change when tiles are conquered.
     """
     row: int
     col: int
     rect: pygame.Rect
     name: str
     category: str
+    _surface_normal: pygame.Surface = field(default=None, repr=False, compare=False)
+    _surface_highlight: pygame.Surface = field(default=None, repr=False, compare=False)
 
 
 class FloorScreen:
     """
     FloorScreen encapsulates the main floor grid and randomizer behavior.
+
+    One instance is meant to live for the whole game: call reset() when
+    returning from a duel instead of constructing a new one.
     """
 
+    # (title, tile, message) fonts, created by the first instance and shared.
+    _fonts = None
+
     def __init__(self, screen, csv_path=config.CSV_FILE_PATH, rows=config.GRID_ROWS, cols=config.GRID_COLS, winner=None, loser=None, defender_category=None, tile_data=None):
         """
         :param screen: the main Pygame display Surface (from set_mode).
@@ -74,7 +136,9 @@ class FloorScreen:
         :param winner: name of the player who won the duel.
         :param loser: name of the player who lost the duel.
         :param defender_category: category used in the previous duel (to be excluded from updates).
-        :param tile_data: optional tile data to use instead of loading from CSV.
+        :param tile_data: optional [name, category] lists to use instead of loading
+                          from CSV. Kept by reference and updated in place as
+                          tiles change hands.
         """
         self.screen = screen
         self.width, self.height = self.screen.get_size()
@@ -82,9 +146,16 @@ class FloorScreen:
         self.cols = cols
 
         # Fonts: one for title, one for tile text, one for the bottom message.
-        self.title_font = pygame.font.SysFont(None, config.FLOOR_TITLE_FONT_SIZE)
-        self.tile_font = pygame.font.SysFont(None, config.FLOOR_TILE_FONT_SIZE)
-        self.message_font = pygame.font.SysFont(None, config.FLOOR_MESSAGE_FONT_SIZE)
+        if FloorScreen._fonts is None:
+            FloorScreen._fonts = (
+                pygame.font.SysFont(None, config.FLOOR_TITLE_FONT_SIZE),
+                pygame.font.SysFont(None, config.FLOOR_TILE_FONT_SIZE),
+                pygame.font.SysFont(None, config.FLOOR_MESSAGE_FONT_SIZE),
+            )
+        self.title_font, self.tile_font, self.message_font = FloorScreen._fonts
+
+        # Rendered title/message lines, keyed by (font, text, color).
+        self._text_surfaces = {}
 
         # Colors (RGB tuples)
         self.bg_color = config.FLOOR_BG_COLOR
@@ -101,7 +172,32 @@ class FloorScreen:
 
         # Build the visual grid (positions + rects).
         self.tiles = self._build_tiles()
+        self._neighbors = self._build_neighbors()
+
+        # Static background + grid, and the screen Rects drawn over it last frame.
+        self._base_surface = None
+        self._last_drawn_rects = None
+        self._build_base_surface()
 
+        # Total duration of the randomizer in milliseconds.
+        self.random_total_duration = config.RANDOMIZER_TOTAL_DURATION_MS
+
+        # Minimum and maximum intervals between jumps (ms).
+        # We start near min_interval and ease toward max_interval as time passes.
+        self.min_interval = config.RANDOMIZER_MIN_INTERVAL_MS
+        self.max_interval = config.RANDOMIZER_MAX_INTERVAL_MS
+
+        self.reset(winner=winner, loser=loser, defender_category=defender_category)
+
+    def reset(self, winner=None, loser=None, defender_category=None):
+        """
+        Reset all per-round state, e.g. when returning from a duel.
+        Tiles (and their ownership) are kept.
+
+        :param winner: name of the player who won the duel.
+        :param loser: name of the player who lost the duel.
+        :param defender_category: category used in the previous duel (to be excluded from updates).
+        """
         # ---------------------------
         # Randomizer state
         # ---------------------------
@@ -114,16 +210,11 @@ class FloorScreen:
         # When the randomizer started (ms since pygame.init()).
         self.random_start_time = None
 
-        # When the next "jump" to a new tile should occur (ms since pygame.init()).
-        self.next_switch_time = None
-
-        # Total duration of the randomizer in milliseconds.
-        self.random_total_duration = config.RANDOMIZER_TOTAL_DURATION_MS
-
-        # Minimum and maximum intervals between jumps (ms).
-        # We start near min_interval and ease toward max_interval as time passes.
-        self.min_interval = config.RANDOMIZER_MIN_INTERVAL_MS
-        self.max_interval = config.RANDOMIZER_MAX_INTERVAL_MS
+        # Pre-computed "jumps" for the current run: switch times (ms since
+        # pygame.init()), the tile index shown at each, and the next one due.
+        self._schedule = []
+        self._schedule_tiles = []
+        self._schedule_pos = 0
 
         # After randomizer ends, we treat the final highlight as origin.
         self.final_tile_index = None
@@ -140,9 +231,10 @@ class FloorScreen:
         self.loser = loser
         self.defender_category = defender_category
         self.awaiting_update = bool(winner and loser)
-        self.duel_message = None
         if self.awaiting_update:
-            self.duel_message = f"Duel ended. Winner: {winner}, Loser: {loser}\nPress SPACE to update the FLOOR!"
+            self._set_duel_message(f"Duel ended. Winner: {winner}, Loser: {loser}\nPress SPACE to update the FLOOR!")
+        else:
+            self._set_duel_message(None)
 
         # Track the active player (who controls the randomizer) - excludes their tiles from selection
         self.active_player = None
@@ -151,6 +243,27 @@ class FloorScreen:
         self.game_over = False
         self.game_winner = None
 
+        # Post-duel click-to-challenge state.
+        self.post_duel_idle = False
+        self.highlighted_indices = []  # Winner's tiles, highlighted while post_duel_idle
+        self._challenge_origins = {}  # Challenger tile for each clickable position
+        self._pending_challenger = None  # Set by a challenge click, consumed by get_selection_payload
+
+        # The previous screen drew over everything: redraw it all.
+        self._last_drawn_rects = None
+        # Set whenever something visible changes; draw() skips otherwise.
+        self._dirty = True
+
+    @property
+    def needs_animation(self):
+        """
+        True while the main loop has to keep ticking at full frame rate:
+        the randomizer is running, or a change has not been drawn yet.
+        Otherwise the floor only changes in response to input, so the loop
+        can block waiting for events.
+        """
+        return self.state == "randomizing" or self._dirty
+
     # ---------------------------------------------------------
     # CSV loading + grid construction
     # ---------------------------------------------------------
@@ -161,22 +274,15 @@ class FloorScreen:
 
         Expected columns: name, category
 
-        Returns a list of dicts: [{"name": ..., "category": ...}, ...]
+        Returns a list of [name, category] lists.
         """
-        data = []
         try:
-            with open(csv_path, newline="", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    name = row.get("name", "").strip()
-                    category = row.get("category", "").strip()
-                    if name:  # only add rows that have a name
-                        data.append({"name": name, "category": category})
+            data = load_tile_data_from_csv(csv_path)
         except FileNotFoundError:
             # If file is missing, create placeholder data.
             print(f"Warning: CSV file {csv_path} not found. Using placeholder tiles.")
             data = [
-                {"name": f"Tile {i + 1}", "category": "Placeholder"}
+                [f"Tile {i + 1}", "Placeholder"]
                 for i in range(self.rows * self.cols)
             ]
 
@@ -185,7 +291,7 @@ class FloorScreen:
         if len(data) < needed:
             # Repeat entries if not enough.
             repeats = (needed // max(1, len(data))) + 1
-            data = (data * repeats)[:needed]
+            data = [tile[:] for tile in (data * repeats)[:needed]]
         else:
             # Trim extras if too many.
             data = data[:needed]
@@ -228,6 +334,15 @@ class FloorScreen:
         # Small padding between tiles so they don't fully touch.
         padding = config.TILE_PADDING
 
+        # Grid geometry + (row, col) lookup, for mapping clicks to tiles.
+        self._grid_left = grid_left
+        self._grid_top = grid_top
+        self._cell_size = cell_size
+        self._tile_by_rc = {}
+        # Owner name -> indices (into the tiles list) of that owner's tiles,
+        # in grid order. Kept up to date by _replace_loser_with_winner.
+        self._tile_indices_by_name = {}
+
         index = 0
         for row in range(self.rows):
             for col in range(self.cols):
@@ -237,19 +352,110 @@ class FloorScreen:
                 h = cell_size - 2 * padding
                 rect = pygame.Rect(x, y, w, h)
 
-                tile_info = self.tile_data[index]
+                name, category = self.tile_data[index]
                 tile = FloorTile(
                     row=row,
                     col=col,
                     rect=rect,
-                    name=tile_info["name"],
-                    category=tile_info["category"],
+                    name=name,
+                    category=category,
                 )
+                self._render_tile(tile)
                 tiles.append(tile)
+                self._tile_by_rc[(row, col)] = tile
+                self._tile_indices_by_name.setdefault(name, []).append(index)
                 index += 1
 
         return tiles
 
+    def _render_tile(self, tile):
+        """
+        Render a tile's cell in both the normal and the highlight color and
+        store them on the tile, so drawing it is a single blit.
+        """
+        tile._surface_normal = self._render_cell(tile, self.tile_color)
+        tile._surface_highlight = self._render_cell(tile, self.highlight_color)
+
+    def _render_cell(self, tile, color):
+        """
+        Render one tile cell (fill, outline, and its text: name, and category
+        if present, stacked and centered) onto a Surface of the tile's size.
+        """
+        cell = _to_display_format(pygame.Surface(tile.rect.size), alpha=False)
+        cell_rect = cell.get_rect()
+
+        # Filled background, plus a subtle border/outline.
+        cell.fill(color)
+        pygame.draw.rect(cell, self.grid_line_color, cell_rect, width=2)
+
+        lines = [tile.name]
+        if tile.category:
+            lines.append(tile.category)
+
+        line_surfs = [
+            self._render_text(self.tile_font, line, self.text_color)
+            for line in lines
+        ]
+
+        # Compute total text height so we can center it block-wise.
+        total_text_height = sum(surf.get_height() for surf in line_surfs)
+        start_y = cell_rect.centery - total_text_height // 2
+
+        for surf in line_surfs:
+            rect = surf.get_rect(center=(cell_rect.centerx, start_y + surf.get_height() // 2))
+            cell.blit(surf, rect)
+            start_y += surf.get_height()
+
+        return cell
+
+    def _build_base_surface(self):
+        """
+        Draw everything that only changes when tiles change (background,
+        title, every tile in its normal color) onto self._base_surface,
+        and force a full-screen update on the next draw().
+        """
+        base = _to_display_format(pygame.Surface(self.screen.get_size()), alpha=False)
+        base.fill(self.bg_color)
+
+        # Title at top: "THE FLOOR!"
+        title_surf = self._render_text(self.title_font, "THE FLOOR!", self.text_color)
+        title_rect = title_surf.get_rect(center=(self.width // 2, 50))
+        base.blit(title_surf, title_rect)
+
+        base.blits([(tile._surface_normal, tile.rect) for tile in self.tiles], doreturn=False)
+
+        self._base_surface = base
+        self._last_drawn_rects = None
+
+    def _set_duel_message(self, message):
+        """
+        Set (or clear, with None) the multi-line duel message and render its
+        lines once, bottom-aligned above the screen's bottom edge, as
+        (Surface, Rect) pairs ready to blit.
+        """
+        self.duel_message = message
+        self._duel_message_surfs = []
+        if not message:
+            return
+
+        lines = message.split("\n")
+        for i, line in enumerate(lines):
+            msg_surf = self._render_text(self.message_font, line, config.YELLOW)
+            msg_rect = msg_surf.get_rect(center=(self.width // 2, self.height - 40 - (len(lines) - i - 1) * 40))
+            self._duel_message_surfs.append((msg_surf, msg_rect))
+
+    def _render_text(self, font, text, color):
+        """
+        Render a line of text, reusing the Surface from an earlier call
+        with the same font, text and color.
+        """
+        key = (id(font), text, color)
+        surf = self._text_surfaces.get(key)
+        if surf is None:
+            surf = _to_display_format(font.render(text, True, color))
+            self._text_surfaces[key] = surf
+        return surf
+
     # ---------------------------------------------------------
     # Helper functions
     # ---------------------------------------------------------
@@ -273,10 +479,7 @@ class FloorScreen:
         Check if all tiles have the same name (game over condition).
         Returns True if one player owns all tiles.
         """
-        if not self.tiles:
-            return False
-        first_name = self.tiles[0].name
-        return all(tile.name == first_name for tile in self.tiles)
+        return len(self._tile_indices_by_name) == 1
 
     def _get_eligible_tile_indices(self):
         """
@@ -298,31 +501,68 @@ class FloorScreen:
         Only picks from eligible tiles (excludes active player's tiles if set).
         """
         eligible_indices = self._get_eligible_tile_indices()
-        if len(eligible_indices) <= 1:
+        n = len(eligible_indices)
+        if n <= 1:
             return eligible_indices[0] if eligible_indices else 0
 
-        while True:
-            idx = random.choice(eligible_indices)
-            if idx != current_index:
-                return idx
+        # eligible_indices is sorted, so find current_index's slot in it.
+        pos = bisect.bisect_left(eligible_indices, current_index)
+        if pos < n and eligible_indices[pos] == current_index:
+            # One draw among the other n-1 slots, skipping over current's slot.
+            j = random.randrange(n - 1)
+            return eligible_indices[j + (j >= pos)]
+        return random.choice(eligible_indices)
 
-    @staticmethod
-    def _are_orthogonally_adjacent(tile_a: FloorTile, tile_b: FloorTile) -> bool:
+    def _tile_at_pixel(self, pos):
+        """
+        Return the tile under a screen position, or None.
+
+        The grid is uniform, so the cell comes straight from the position;
+        the final rect check rejects clicks in the padding between tiles.
         """
-        Returns True if tile_b is orthogonally adjacent (up/down/left/right)
-        to tile_a on the grid.
+        x, y = pos
+        col = (x - self._grid_left) // self._cell_size
+        row = (y - self._grid_top) // self._cell_size
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            return None
+        tile = self._tile_by_rc.get((row, col))
+        if tile is None or not tile.rect.collidepoint(pos):
+            return None
+        return tile
 
-        This uses the difference in row/col:
+    def _build_neighbors(self):
+        """
+        Map each tile's (row, col) to the frozenset of (row, col) positions
+        orthogonally adjacent to it (up/down/left/right) on the grid:
             - Up:    (row-1, col)
             - Down:  (row+1, col)
             - Left:  (row, col-1)
             - Right: (row, col+1)
 
         (No diagonals. If you want diagonals, change this.)
+        The grid is fixed, so this is computed once.
+        """
+        neighbors = {}
+        for tile in self.tiles:
+            r, c = tile.row, tile.col
+            neighbors[(r, c)] = frozenset(
+                pos for pos in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1))
+                if pos in self._tile_by_rc
+            )
+        return neighbors
+
+    def _build_challenge_origins(self):
         """
-        dr = abs(tile_a.row - tile_b.row)
-        dc = abs(tile_a.col - tile_b.col)
-        return (dr + dc) == 1  # exactly one step horizontally or vertically
+        For post-duel idle: map every position adjacent to one of the
+        highlighted (winner's) tiles to the first such tile, so a click
+        only needs one dict lookup to find its challenger tile.
+        """
+        origins = {}
+        for i in self.highlighted_indices:
+            my_tile = self.tiles[i]
+            for pos in self._neighbors[(my_tile.row, my_tile.col)]:
+                origins.setdefault(pos, my_tile)
+        self._challenge_origins = origins
 
     # ---------------------------------------------------------
     # Public API: handle_event, update, draw
@@ -334,10 +574,14 @@ class FloorScreen:
 
         :param event: a Pygame event object.
         """
+        if event.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN):
+            # Every reaction to input is visible (or harmless to redraw).
+            self._dirty = True
+
         if self.awaiting_update and event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
             self._replace_loser_with_winner()
             self.awaiting_update = False
-            self.duel_message = None
+            self._set_duel_message(None)
             # Check if game is over (all tiles have the same name)
             if self._check_game_over():
                 self.game_over = True
@@ -346,17 +590,17 @@ class FloorScreen:
             else:
                 # Set a new message for post-duel idle state
                 self.post_duel_idle = True
+                self._build_challenge_origins()
             return
         # Allow click-to-challenge in idle state after a duel update
-        if hasattr(self, 'post_duel_idle') and self.post_duel_idle and event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+        if self.post_duel_idle and event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             self._handle_click_to_challenge(event.pos)
             return
 
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_SPACE and self.state == "idle":
                 self.state = "idle"
-                if hasattr(self, 'post_duel_idle'):
-                    self.post_duel_idle = False
+                self.post_duel_idle = False
                 self._start_randomizer()
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1 and self.state == "finished":
@@ -380,12 +624,43 @@ class FloorScreen:
         # Start by highlighting a random eligible tile.
         self.highlighted_index = random.choice(eligible_indices)
 
-        # Schedule the first switch.
-        self.next_switch_time = self.random_start_time + self.min_interval
+        # Plan every switch (and the tile it lands on) up front.
+        self._build_schedule()
 
         # We don't yet know the final tile; will be set when animation ends.
         self.final_tile_index = None
 
+    def _build_schedule(self):
+        """
+        Pre-compute the whole randomizer run: the time of every switch and
+        the tile it moves to, so update() only has to compare timestamps.
+
+        The first switch happens min_interval after the start; each interval
+        after that grows from min_interval toward max_interval along an
+        ease-out curve of the elapsed time.
+        """
+        schedule = []
+        schedule_tiles = []
+        end_time = self.random_start_time + self.random_total_duration
+        switch_time = self.random_start_time + self.min_interval
+        tile_index = self.highlighted_index
+        while switch_time < end_time:
+            # Choose a new tile index different from the current one.
+            tile_index = self._pick_next_tile_index(tile_index)
+            schedule.append(switch_time)
+            schedule_tiles.append(tile_index)
+
+            # Current interval between switches, from min_interval to max_interval.
+            t = (switch_time - self.random_start_time) / self.random_total_duration
+            eased = self._ease_out_quad(t)
+            switch_time += int(
+                self.min_interval + (self.max_interval - self.min_interval) * eased
+            )
+
+        self._schedule = schedule
+        self._schedule_tiles = schedule_tiles
+        self._schedule_pos = 0
+
     def _handle_click(self, mouse_pos):
         """
         Handle a mouse click when the state is 'finished'.
@@ -403,11 +678,7 @@ class FloorScreen:
         final_tile = self.tiles[self.final_tile_index]
 
         # Find which tile (if any) the user clicked.
-        clicked_tile = None
-        for tile in self.tiles:
-            if tile.rect.collidepoint(mouse_pos):
-                clicked_tile = tile
-                break
+        clicked_tile = self._tile_at_pixel(mouse_pos)
 
         if clicked_tile is None:
             return  # clicked outside any tile
@@ -418,7 +689,7 @@ class FloorScreen:
             return
 
         # Check adjacency (up/down/left/right).
-        if self._are_orthogonally_adjacent(final_tile, clicked_tile):
+        if (clicked_tile.row, clicked_tile.col) in self._neighbors[(final_tile.row, final_tile.col)]:
             # Record positions for the next screen (DuelScreen, etc.).
             self.selected_origin = (final_tile.row, final_tile.col)
             self.selected_target = (clicked_tile.row, clicked_tile.col)
@@ -430,11 +701,7 @@ class FloorScreen:
             print("Clicked tile is not adjacent to the final tile. Ignoring.")
 
     def _handle_click_to_challenge(self, mouse_pos):
-        clicked_tile = None
-        for tile in self.tiles:
-            if tile.rect.collidepoint(mouse_pos):
-                clicked_tile = tile
-                break
+        clicked_tile = self._tile_at_pixel(mouse_pos)
         if clicked_tile is None:
             return
         
@@ -443,46 +710,34 @@ class FloorScreen:
             print("Cannot challenge your own tile. Ignoring.")
             return
             
-        my_tiles = [self.tiles[i] for i in getattr(self, 'highlighted_indices', [])]
-        for my_tile in my_tiles:
-            if self._are_orthogonally_adjacent(my_tile, clicked_tile) and clicked_tile.name != self.winner:
-                self.selected_origin = (my_tile.row, my_tile.col)
-                self.selected_target = (clicked_tile.row, clicked_tile.col)
-                # Always set _pending_challenger to a non-None value
-                self._pending_challenger = self.winner if self.winner else my_tile.name
-                self.request_screen_change = "duel"
-                print(f"Challenge: {self._pending_challenger} (challenger) vs {clicked_tile.name} (defender)")
-                return
+        my_tile = self._challenge_origins.get((clicked_tile.row, clicked_tile.col))
+        if my_tile is not None and clicked_tile.name != self.winner:
+            self.selected_origin = (my_tile.row, my_tile.col)
+            self.selected_target = (clicked_tile.row, clicked_tile.col)
+            # Always set _pending_challenger to a non-None value
+            self._pending_challenger = self.winner if self.winner else my_tile.name
+            self.request_screen_change = "duel"
+            print(f"Challenge: {self._pending_challenger} (challenger) vs {clicked_tile.name} (defender)")
+            return
         print("Clicked tile is not adjacent to any of your tiles or is your own tile.")
 
     def get_selection_payload(self):
         if self.request_screen_change != "duel":
             return None
-        def find_tile_by_pos(pos):
-            row, col = pos
-            for tile in self.tiles:
-                if tile.row == row and tile.col == col:
-                    return tile
-            return None
-        challenger_tile = find_tile_by_pos(self.selected_origin)
-        defender_tile = find_tile_by_pos(self.selected_target)
+        challenger_tile = self._tile_by_rc.get(self.selected_origin)
+        defender_tile = self._tile_by_rc.get(self.selected_target)
         if challenger_tile is None or defender_tile is None:
             return None
-        # Always use _pending_challenger if set and not None
-        challenger_name = getattr(self, '_pending_challenger', None)
-        if not challenger_name:
-            challenger_name = challenger_tile.name
-        
+        # Always use _pending_challenger if set, then clear it
+        challenger_name = self._pending_challenger or challenger_tile.name
+        self._pending_challenger = None
+
         # Safety check: prevent same-name duels
         if challenger_name == defender_tile.name:
             print(f"Preventing same-name duel: {challenger_name} vs {defender_tile.name}")
             self.request_screen_change = None
-            if hasattr(self, '_pending_challenger'):
-                del self._pending_challenger
             return None
-            
-        if hasattr(self, '_pending_challenger'):
-            del self._pending_challenger
+
         return {
             "challenger_name": challenger_name,
             "defender_name": defender_tile.name,
@@ -500,32 +755,18 @@ class FloorScreen:
         """
         if self.state == "randomizing":
             now = pygame.time.get_ticks()
-            elapsed = now - self.random_start_time
 
-            if elapsed >= self.random_total_duration:
+            # Apply every switch that has come due (normally zero or one).
+            while self._schedule_pos < len(self._schedule) and now >= self._schedule[self._schedule_pos]:
+                self.highlighted_index = self._schedule_tiles[self._schedule_pos]
+                self._schedule_pos += 1
+                self._dirty = True
+
+            if now - self.random_start_time >= self.random_total_duration:
                 # Randomizer finished; lock in the final tile.
                 self.state = "finished"
                 self.final_tile_index = self.highlighted_index
-                return
-
-            # If it's time to switch to another tile, do so.
-            if now >= self.next_switch_time:
-                # Compute progress in [0, 1].
-                t = elapsed / self.random_total_duration
-
-                # Ease-out curve for interval growth.
-                eased = self._ease_out_quad(t)
-
-                # Current interval between switches, from min_interval to max_interval.
-                current_interval = int(
-                    self.min_interval + (self.max_interval - self.min_interval) * eased
-                )
-
-                # Choose a new tile index different from the current one.
-                self.highlighted_index = self._pick_next_tile_index(self.highlighted_index)
-
-                # Schedule the next switch.
-                self.next_switch_time = now + current_interval
+                self._dirty = True
 
         # If state is "idle" or "finished", nothing time-based happens here for now.
         # Future: you could animate UI, show prompts, etc.
@@ -534,85 +775,53 @@ class FloorScreen:
     def draw(self):
         """
         Draw the entire floor view onto self.screen.
-        """
-        # Clear background.
-        self.screen.fill(self.bg_color)
 
-        # ----------------------------
-        # Draw duel message if present
-        # ----------------------------
-        if self.duel_message:
-            lines = self.duel_message.split("\n")
-            for i, line in enumerate(lines):
-                msg_surf = self.message_font.render(line, True, config.YELLOW)
-                msg_rect = msg_surf.get_rect(center=(self.width // 2, self.height - 40 - (len(lines)-i-1)*40))
-                self.screen.blit(msg_surf, msg_rect)
+        The background, title and all tiles in their normal color come from
+        self._base_surface; only highlighted tiles and messages are drawn on
+        top each frame, collected into one list and drawn with a single
+        blits() call.
 
-        # ----------------------------
-        # Draw title at top: "THE FLOOR!"
-        # ----------------------------
-        title_surf = self.title_font.render("THE FLOOR!", True, self.text_color)
-        title_rect = title_surf.get_rect(center=(self.width // 2, 50))
-        self.screen.blit(title_surf, title_rect)
+        Returns the list of screen Rects that changed (for
+        pygame.display.update()): the areas drawn on top of the base this
+        frame and last frame, or the whole screen when the base changed.
+        Returns [] if nothing has changed since the last draw.
+        """
+        if not self._dirty and self._last_drawn_rects is not None:
+            return []
+        self._dirty = False
+
+        # Background, title and un-highlighted tiles.
+        self.screen.blit(self._base_surface, (0, 0))
 
         # ----------------------------
-        # Draw tiles
+        # Draw highlighted tiles
         # ----------------------------
-        for index, tile in enumerate(self.tiles):
-            # Highlight all winner's tiles in post-duel idle
-            if hasattr(self, 'post_duel_idle') and self.post_duel_idle and hasattr(self, 'highlighted_indices') and index in self.highlighted_indices:
-                color = self.highlight_color
-            elif index == self.highlighted_index:
-                color = self.highlight_color
-            else:
-                color = self.tile_color
-
-            # Draw filled rectangle for the tile.
-            pygame.draw.rect(self.screen, color, tile.rect)
+        highlighted = set()
+        # Highlight all winner's tiles in post-duel idle
+        if self.post_duel_idle:
+            highlighted.update(self.highlighted_indices)
+        if self.highlighted_index is not None:
+            highlighted.add(self.highlighted_index)
 
-            # Optional: draw a subtle border/outline.
-            pygame.draw.rect(self.screen, self.grid_line_color, tile.rect, width=2)
-
-            # Draw tile text: name (and maybe category) centered.
-            # For now we draw the name and category stacked vertically if category exists.
-            lines = [tile.name]
-            if tile.category:
-                lines.append(tile.category)
-
-            # Render each line.
-            line_surfs = [
-                self.tile_font.render(line, True, self.text_color)
-                for line in lines
-            ]
-
-            # Compute total text height so we can center it block-wise.
-            total_text_height = sum(surf.get_height() for surf in line_surfs)
-            start_y = tile.rect.centery - total_text_height // 2
-
-            for surf in line_surfs:
-                rect = surf.get_rect(center=(tile.rect.centerx, start_y + surf.get_height() // 2))
-                self.screen.blit(surf, rect)
-                start_y += surf.get_height()
+        tiles = self.tiles
+        draws = [(tiles[i]._surface_highlight, tiles[i].rect) for i in highlighted]
 
         # ----------------------------
         # Draw bottom message
         # ----------------------------
         if self.game_over:
             message = f"{self.game_winner} has won The Floor!"
-            message_surf = self.message_font.render(message, True, config.GOLD)
+            message_surf = self._render_text(self.message_font, message, config.GOLD)
             message_rect = message_surf.get_rect(center=(self.width // 2, self.height - 40))
-            self.screen.blit(message_surf, message_rect)
-        elif self.duel_message:
-            lines = self.duel_message.split("\n")
-            for i, line in enumerate(lines):
-                msg_surf = self.message_font.render(line, True, config.YELLOW)
-                msg_rect = msg_surf.get_rect(center=(self.width // 2, self.height - 40 - (len(lines)-i-1)*40))
-                self.screen.blit(msg_surf, msg_rect)
-        elif hasattr(self, 'post_duel_idle') and self.post_duel_idle:
+            draws.append((message_surf, message_rect))
+        elif self._duel_message_surfs:
+            # Pre-rendered by _set_duel_message.
+            draws.extend(self._duel_message_surfs)
+        elif self.post_duel_idle:
             message = "Press SPACE to ACTIVATE THE RANDOMIZER or click a category to start a challenge!"
-            message_surf = self.message_font.render(message, True, self.text_color)
+            message_surf = self._render_text(self.message_font, message, self.text_color)
             message_rect = message_surf.get_rect(center=(self.width // 2, self.height - 40))
-            self.screen.blit(message_surf, message_rect)
+            draws.append((message_surf, message_rect))
         else:
             if self.state == "idle":
                 message = "Press SPACE to ACTIVATE THE RANDOMIZER"
@@ -621,13 +830,26 @@ class FloorScreen:
             else:  # finished
                 message = "Click a tile adjacent to the highlighted one!"
 
-            message_surf = self.message_font.render(message, True, self.text_color)
+            message_surf = self._render_text(self.message_font, message, self.text_color)
             message_rect = message_surf.get_rect(center=(self.width // 2, self.height - 40))
-            self.screen.blit(message_surf, message_rect)
+            draws.append((message_surf, message_rect))
+
+        self.screen.blits(draws, doreturn=False)
+        drawn_rects = [rect for _, rect in draws]
+
+        if self._last_drawn_rects is None:
+            # First frame since the base changed: everything is new.
+            dirty_rects = [self.screen.get_rect()]
+        else:
+            dirty_rects = self._last_drawn_rects + drawn_rects
+        self._last_drawn_rects = drawn_rects
+        return dirty_rects
 
     def _replace_loser_with_winner(self):
-        winner_tile = next((t for t in self.tiles if t.name == self.winner), None)
-        loser_tile = next((t for t in self.tiles if t.name == self.loser), None)
+        winner_indices = self._tile_indices_by_name.get(self.winner)
+        loser_indices = self._tile_indices_by_name.pop(self.loser, [])
+        winner_tile = self.tiles[winner_indices[0]] if winner_indices else None
+        loser_tile = self.tiles[loser_indices[0]] if loser_indices else None
 
         # Determine which category to use (the one that WASN'T the defender category)
         if self.defender_category and winner_tile and loser_tile:
@@ -647,19 +869,28 @@ class FloorScreen:
             new_category = winner_tile.category if winner_tile else None
 
         # First, convert all loser's tiles to winner's tiles
-        for i, tile in enumerate(self.tiles):
-            if tile.name == self.loser:
-                tile.name = self.winner
-                self.tile_data[i]["name"] = self.winner
-
-        # Then, update ALL winner's tiles (both existing and newly conquered) with the new category
-        for i, tile in enumerate(self.tiles):
-            if tile.name == self.winner and new_category:
+        for i in loser_indices:
+            self.tiles[i].name = self.winner
+            self.tile_data[i][0] = self.winner
+        if loser_indices:
+            winner_indices = self._tile_indices_by_name.setdefault(self.winner, [])
+            winner_indices.extend(loser_indices)
+            winner_indices.sort()
+        winner_indices = self._tile_indices_by_name.get(self.winner, [])
+
+        # Then, update ALL winner's tiles (both existing and newly conquered) with
+        # the new category, and re-render the cells that changed owner/category
+        for i in winner_indices:
+            tile = self.tiles[i]
+            if new_category:
                 tile.category = new_category
-                self.tile_data[i]["category"] = new_category
+                self.tile_data[i][1] = new_category
+            self._render_tile(tile)
+
+        self._build_base_surface()
 
         # After update, highlight all winner's tiles
-        self.highlighted_indices = [i for i, t in enumerate(self.tiles) if t.name == self.winner]
+        self.highlighted_indices = list(winner_indices)
         # Set the active player - their tiles will be excluded from the next randomizer
         self.active_player = self.winner
         # No CSV write here; in-memory only
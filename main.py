@@ -18,26 +18,18 @@ Flow:
 - (Optional) Press ENTER in DuelScreen to go back to FloorScreen.
 """
 
-import copy
-import csv
+import os
+
+# Use SDL2's alpha blitter, which is faster than pygame's own on ARM
+# (e.g. Raspberry Pi). Must be set before pygame is imported.
+os.environ.setdefault("PYGAME_BLEND_ALPHA_SDL2", "1")
+
 import pygame
-from floor import FloorScreen
+from floor import FloorScreen, load_tile_data_from_csv
 from duel import DuelScreen
 import config
 
 
-def load_tile_data_from_csv(csv_path):
-    data = []
-    with open(csv_path, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            name = row.get("name", "").strip()
-            category = row.get("category", "").strip()
-            if name:
-                data.append({"name": name, "category": category})
-    return data
-
-
 def main():
     # Initialize Pygame.
     pygame.init()
@@ -49,9 +41,9 @@ def main():
     # Clock for FPS limiting and delta time.
     clock = pygame.time.Clock()
 
-    # Load initial tile data from CSV ONCE
-    initial_tile_data = load_tile_data_from_csv(config.CSV_FILE_PATH)
-    active_tile_data = copy.deepcopy(initial_tile_data)
+    # Load tile data from CSV ONCE. The loader returns fresh lists, and
+    # FloorScreen updates them in place when a duel result is applied.
+    active_tile_data = load_tile_data_from_csv(config.CSV_FILE_PATH)
 
     # -------------------------
     # Screen / mode setup
@@ -64,12 +56,22 @@ def main():
     running = True
     while running:
         # delta_ms: milliseconds since last frame.
-        delta_ms = clock.tick(config.FPS)
+        if current_screen.needs_animation:
+            # Something is moving: run at the full frame rate.
+            delta_ms = clock.tick(config.FPS)
+            events = pygame.event.get()
+        else:
+            # Nothing to animate: sleep until input arrives (or the timeout).
+            first_event = pygame.event.wait(config.IDLE_EVENT_TIMEOUT_MS)
+            events = pygame.event.get()
+            if first_event.type != pygame.NOEVENT:
+                events.insert(0, first_event)
+            delta_ms = clock.tick()
 
         # -------------------------
         # Event handling
         # -------------------------
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
 
@@ -77,6 +79,12 @@ def main():
                 # ESC quits the whole app.
                 running = False
 
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED):
+                # SDL doesn't repaint the window by itself, and screens only
+                # push changed areas; the display Surface still holds the
+                # last frame, so push all of it again.
+                pygame.display.flip()
+
             else:
                 # Forward all other events to whichever screen is active.
                 current_screen.handle_event(event)
@@ -85,8 +93,12 @@ def main():
         # Update & draw
         # -------------------------
         current_screen.update(delta_ms)
-        current_screen.draw()
-        pygame.display.flip()
+        dirty_rects = current_screen.draw()
+        if dirty_rects is None:
+            # Screen doesn't track changed areas; push the whole frame.
+            pygame.display.flip()
+        elif dirty_rects:
+            pygame.display.update(dirty_rects)
 
         # -------------------------
         # Screen switching logic
@@ -122,24 +134,14 @@ def main():
                     loser = req.get("loser")
                     defender_category = req.get("defender_category")
                     # Do NOT update active_tile_data yet; wait for SPACE in FloorScreen
-                    floor_screen = FloorScreen(screen, winner=winner, loser=loser, defender_category=defender_category, tile_data=active_tile_data)
+                    floor_screen.reset(winner=winner, loser=loser, defender_category=defender_category)
                     current_screen = floor_screen
                     mode = "floor"
                 elif req == "floor":
-                    floor_screen = FloorScreen(screen, tile_data=active_tile_data)
+                    floor_screen.reset()
                     current_screen = floor_screen
                     mode = "floor"
 
-        # After draw, if we're on FloorScreen and just finished the update, sync tile_data
-        if mode == "floor" and hasattr(current_screen, "awaiting_update") and not current_screen.awaiting_update and current_screen.winner and current_screen.loser:
-            # Copy updated tile data back to active_tile_data
-            for i, tile in enumerate(current_screen.tile_data):
-                active_tile_data[i]["name"] = tile["name"]
-                active_tile_data[i]["category"] = tile["category"]
-            # Reset winner/loser so this doesn't repeat
-            current_screen.winner = None
-            current_screen.loser = None
-
     pygame.quit()
 
 
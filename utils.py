@@ -1,16 +1,31 @@
+import csv
 import os
-import pandas as pd
 import config
+from duel import prescale_images
 
 def create_img_folders(folder_path=config.IMAGES_BASE_PATH, categories_path=config.CSV_FILE_PATH):
-    if not os.path.exists(folder_path):
-        os.makedirs(folder_path)
-    
-    categories = pd.read_csv(categories_path)
+    os.makedirs(folder_path, exist_ok=True)
 
-    for category in categories['category'].unique():
-        if not os.path.exists(os.path.join(folder_path, category)):
-            os.makedirs(os.path.join(folder_path, category))
+    with open(categories_path, newline="", encoding="utf-8") as f:
+        categories = {
+            row["category"].strip()
+            for row in csv.DictReader(f)
+            if row.get("category")
+        }
+
+    # One directory scan instead of an exists() check per category
+    existing = {e.name for e in os.scandir(folder_path) if e.is_dir()}
+    for category in categories - existing:
+        os.makedirs(os.path.join(folder_path, category), exist_ok=True)
+
+def prescale_category_images(folder_path=config.IMAGES_BASE_PATH):
+    if not os.path.isdir(folder_path):
+        return
+
+    category_folders = [e.path for e in os.scandir(folder_path) if e.is_dir()]
+    scaled = prescale_images(category_folders)
+    print(f"Pre-scaled {scaled} image(s) in {folder_path}")
 
 if __name__ == "__main__":
-    create_img_folders()
\ No newline at end of file
+    create_img_folders()
+    prescale_category_images()
\ No newline at end of file